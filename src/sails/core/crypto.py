@@ -1,13 +1,18 @@
-import base64
 import binascii
 from dataclasses import dataclass
 from datetime import timedelta
 import hashlib
 import hmac
+import os
 import struct
 import time
-from typing import Type
-from cryptography.fernet import Fernet
+from typing import Type, Union
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+try:
+    from pybase64 import urlsafe_b64decode, urlsafe_b64encode
+except ImportError:
+    from base64 import urlsafe_b64decode, urlsafe_b64encode
 
 from sails.common.exceptions import MessagedException
 
@@ -24,6 +29,42 @@ VERSION = 1
 :type: int
 """
 
+HEADER_PREFIX = bytes([VERSION, 0, 0])
+"""The constant leading bytes of a signature header: the version byte and padding.
+
+:type: bytes
+"""
+
+HEADER_SIZE = BYTE_FORMAT.size
+"""The size in bytes of a packed signature header.
+
+:type: int
+"""
+
+SHA384_DIGEST_SIZE = hashlib.sha384().digest_size
+"""The size in bytes of a SHA384 digest.
+
+:type: int
+"""
+
+SIGNATURE_SIZE = HEADER_SIZE + SHA384_DIGEST_SIZE
+"""The size in bytes of a decoded signature: the header followed by the digest.
+
+:type: int
+"""
+
+SHA384_BLOCK_SIZE = hashlib.sha384().block_size
+"""The size in bytes of a SHA384 input block.
+
+:type: int
+"""
+
+NONCE_SIZE = 12
+"""The size in bytes of an AES-GCM nonce.
+
+:type: int
+"""
+
 
 @dataclass
 class SignatureHeader:
@@ -49,6 +90,37 @@ class Secret:
 
     data: bytes
 
+    def hmac_sha384(self, payload: bytes) -> bytes:
+        """Compute the HMAC-SHA384 digest of a payload using this secret.
+
+        The ipad/opad key schedule is computed once per secret and cached, so
+        repeated calls only pay for hashing the payload itself.
+
+        :param payload: The payload to authenticate.
+        :type payload: bytes
+        :return: The HMAC-SHA384 digest of the payload.
+        :rtype: bytes
+        """
+        try:
+            ipad, opad = self._key_schedule
+        except AttributeError:
+            key: bytes = self.data
+
+            if len(key) > SHA384_BLOCK_SIZE:
+                key = hashlib.sha384(key).digest()
+
+            key = key.ljust(SHA384_BLOCK_SIZE, b"\x00")
+            ipad = hashlib.sha384(bytes(byte ^ 0x36 for byte in key))
+            opad = hashlib.sha384(bytes(byte ^ 0x5C for byte in key))
+            self._key_schedule = (ipad, opad)
+
+        inner = ipad.copy()
+        inner.update(payload)
+        outer = opad.copy()
+        outer.update(inner.digest())
+
+        return outer.digest()
+
 
 SignedSecret: Type[bytes] = bytes
 """A type alias for bytes representing a signed secret.
@@ -88,11 +160,15 @@ class Signature:
         :rtype: `SignedSecret`
         """
         expiry: int = int(time.time() + max_age.total_seconds())
-        header: bytes = BYTE_FORMAT.pack(VERSION, expiry)
+        header: bytes = HEADER_PREFIX + expiry.to_bytes(4, "little")
         payload: bytes = header + message.encode("utf8")
-        digest: bytes = hmac.new(secret.data, payload, hashlib.sha384).digest()
+        digest: bytes = secret.hmac_sha384(payload)
+
+        signed: bytearray = bytearray(len(header) + SHA384_DIGEST_SIZE)
+        signed[: len(header)] = header
+        signed[len(header) :] = digest
 
-        return base64.urlsafe_b64encode(header + digest)
+        return urlsafe_b64encode(signed)
 
     @staticmethod
     def verify(
@@ -111,25 +187,26 @@ class Signature:
         :raises: `SignatureError`: If the signature was corrupt, has expired, or is not valid.
         """
         try:
-            decoded_signature: bytes = base64.urlsafe_b64decode(signature)
-            header: bytes = decoded_signature[: BYTE_FORMAT.size]
-            digest: bytes = decoded_signature[BYTE_FORMAT.size :]
-            version, expiry = BYTE_FORMAT.unpack(header)
+            decoded_signature: memoryview = memoryview(urlsafe_b64decode(signature))
 
-            if version != VERSION:
+            if len(decoded_signature) != SIGNATURE_SIZE:
                 raise ValueError
-            if len(digest) != hashlib.sha384().digest_size:
+
+            header: bytes = bytes(decoded_signature[:HEADER_SIZE])
+            digest: memoryview = decoded_signature[HEADER_SIZE:]
+            version: int = header[0]
+            expiry: int = int.from_bytes(header[3:7], "little")
+
+            if version != VERSION:
                 raise ValueError
-        except (struct.error, KeyError, binascii.Error, TypeError, ValueError):
+        except (KeyError, binascii.Error, TypeError, ValueError):
             raise SignatureError("The signature was corrupt and cannot be read.")
 
         if time.time() > expiry:
             raise SignatureError("The signature has expired and is no longer valid.")
 
         payload: bytes = header + message.encode("utf8")
-        compared_digest: bytes = hmac.new(
-            secret.data, payload, hashlib.sha384()
-        ).digest()
+        compared_digest: bytes = secret.hmac_sha384(payload)
 
         if not hmac.compare_digest(compared_digest, digest):
             raise SignatureError(
@@ -141,19 +218,20 @@ class Signature:
 
 class Encrypt:
     @staticmethod
-    def write(message: str, secret: Secret) -> bytes:
+    def write(message: Union[str, bytes], secret: Secret) -> bytes:
         """Encrypt a message using a given secret.
 
         :param message: The message to be encrypted.
-        :type message: str
+        :type message: Union[str, bytes]
         :param secret: The secret key to use for encryption.
         :type secret: `Secret`
         :return: The encrypted message as bytes.
         :rtype: bytes
         """
-        fernet: Fernet = Fernet(secret.data)
-        xor_message: str = message ^ secret
-        return fernet.encrypt(xor_message.encode())
+        cipher: AESGCM = AESGCM(secret.data[:32])
+        nonce: bytes = os.urandom(NONCE_SIZE)
+        data: bytes = message.encode() if isinstance(message, str) else bytes(message)
+        return nonce + cipher.encrypt(nonce, data, None)
 
     @staticmethod
     def read(raw: bytes, secret: Secret) -> bytes:
@@ -166,6 +244,5 @@ class Encrypt:
         :return: The decrypted message as bytes.
         :rtype: bytes
         """
-        fernet: Fernet = Fernet(secret.data)
-        decoded_message: bytes = fernet.decrypt(raw)
-        return decoded_message ^ secret.data
+        cipher: AESGCM = AESGCM(secret.data[:32])
+        return cipher.decrypt(raw[:NONCE_SIZE], raw[NONCE_SIZE:], None)
@@ -10,4 +10,8 @@ def years_since(date: datetime) -> int:
     :rtype: int
     """
     today = datetime.today()
-    return today.year - date.year - ((today.month, today.day) < (date.month, date.day))
+    return (
+        today.year
+        - date.year
+        - (today.month * 32 + today.day < date.month * 32 + date.day)
+    )
@@ -1,4 +1,6 @@
+import mmap
 import os
+import time
 from dataclasses import dataclass
 from types import TracebackType
 from typing import IO, Callable, Generic, Optional, Type, Union, cast
@@ -9,6 +11,13 @@ from sails.core.crypto import Secret, Encrypt
 from sails.core.retry import Retry
 
 
+STAT_INTERVAL = 0.05
+"""The minimum time in seconds between stat syscalls on an observed file.
+
+:type: float
+"""
+
+
 @dataclass
 class Options:
     """A class to represent the options for file opening.
@@ -55,31 +64,39 @@ class EncryptedFileWriter:
         """Initialize the EncryptedFileWriter object."""
         self.path: str = path
         self.secret: Secret = secret
-        self.buffer: list[bytes] = []
+        self.buffer: bytearray = bytearray()
 
     def __enter__(self) -> bool:
         """Enter the context."""
         return True
 
     def write(self, message: str) -> None:
-        """Write an encrypted message to the buffer.
+        """Write a message to the buffer.
 
         :param message: The message to write.
         :type message: str
         """
-        encrypted_message: bytes = Encrypt.write(message + "\n", self.secret)
-        self.buffer.append(encrypted_message)
+        self.buffer += (message + "\n").encode()
 
     def commit(self) -> bool:
-        """Write the encrypted messages in the buffer to the file.
+        """Encrypt the buffered messages and write them to the file.
+
+        The buffer is encrypted as a single ciphertext, so the cipher setup
+        cost is paid once per commit rather than once per line.
 
         :return: True if the writing was successful, False otherwise.
         :rtype: bool
         """
-        with open(self.path, "wb") as handle:
-            for line_number, line in enumerate(self.buffer):
-                handle.write(line)
-                self.buffer[line_number] = "0" * len(line)
+        encrypted_buffer: bytes = Encrypt.write(self.buffer, self.secret)
+        handle: int = os.open(self.path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+
+        try:
+            os.write(handle, encrypted_buffer)
+        finally:
+            os.close(handle)
+
+        self.buffer.clear()
+        return True
 
     def __exit__(
         self,
@@ -88,8 +105,8 @@ class EncryptedFileWriter:
         exc_tb: Optional[TracebackType],
     ) -> None:
         """Exit the context."""
-        del buffer
-        del secret
+        del self.buffer
+        del self.secret
 
 
 class EncryptedFileReader:
@@ -128,15 +145,18 @@ class EncryptedFileReader:
         """
         Read the encrypted file and provide a decrypted version of its content.
 
+        The file is mapped into memory and decrypted as a single ciphertext,
+        so the cipher setup cost is paid once per read rather than once per line.
+
         :return: A list of decrypted strings, where each string corresponds to a line in the encrypted file.
         :rtype: list[str]
         """
         with open(self.path, "rb") as handle:
-            for line in handle.readlines():
-                decrypted_message: str = Encrypt.read(line, self.secret).decode()
-                self.buffer.append(decrypted_message.rstrip("\n"))
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as view:
+                decrypted_buffer: str = Encrypt.read(bytes(view), self.secret).decode()
 
-            return self.buffer
+        self.buffer = decrypted_buffer.splitlines()
+        return self.buffer
 
     def __exit__(
         self,
@@ -191,24 +211,24 @@ class ObservedFile(Generic[T]):
         self.data: Union[T, Type[None]] = None
         self.backoff: float = backoff
         self.options: Options = Options("rb" if binary else "r", encoding, newline)
+        self._last_stat_time: float = 0.0
 
         if timeout:
             last_error: Optional[FileNotFoundError] = None
 
             for _ in Retry(time=timeout, backoff=backoff):
-                if self.data:
-                    break
                 try:
                     self.get_data()
                 except FileNotFoundError as e:
                     last_error = e
                 else:
                     break
+            else:
+                raise FileNotFoundError(
+                    f"Timed out trying to find {self.path}, likely file does not exist"
+                ) from last_error
         else:
-            last_error = cast(FileNotFoundError, last_error)
-            raise FileNotFoundError(
-                f"Timed out trying to find {self.path}, likely file does not exist"
-            )
+            self.get_data()
 
     def get_data(self) -> T:
         """Get the parsed data of the observed file.
@@ -229,6 +249,13 @@ class ObservedFile(Generic[T]):
 
         :returns: A tuple of the parsed data and modified time of the observed file.
         """
+        now: float = time.monotonic()
+
+        if self.data and now - self._last_stat_time < STAT_INTERVAL:
+            return cast(T, self.data), self.modified_time
+
+        self._last_stat_time = now
+
         try:
             modified_time = os.path.getmtime(self.path)
         except OSError as e:
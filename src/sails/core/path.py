@@ -2,6 +2,19 @@ import os
 import platform
 
 
+IS_WINDOWS = "windows" in platform.system().lower()
+"""Whether the host platform is Windows.
+
+:type: bool
+"""
+
+if IS_WINDOWS:
+    import ctypes
+
+    _set_file_attributes = ctypes.windll.kernel32.SetFileAttributesW
+    _set_file_attributes.argtypes = (ctypes.c_wchar_p, ctypes.c_uint32)
+
+
 def get_filename(path: str) -> str:
     """
     This function returns the base name of the path specified.
@@ -35,7 +48,8 @@ def up_directory(path: str) -> str:
     :return: The parent directory of the file.
     :rtype: str
     """
-    return os.path.sep.join(path.split(os.path.sep)[:-1])
+    separator: int = path.rfind(os.path.sep)
+    return path[:separator] if separator >= 0 else ""
 
 
 def get_extension(path: str) -> str:
@@ -47,8 +61,9 @@ def get_extension(path: str) -> str:
     :return: The extension of the file.
     :rtype: str
     """
-    filename: str = get_filename(path)
-    return os.path.splitext(filename)[1]
+    filename: str = path[path.rfind(os.sep) + 1 :]
+    dot: int = filename.rfind(".")
+    return filename[dot:] if dot > 0 else ""
 
 
 def get_filename_no_extension(path: str) -> str:
@@ -60,8 +75,9 @@ def get_filename_no_extension(path: str) -> str:
     :return: The base name of the file without the extension.
     :rtype: str
     """
-    filename: str = get_filename(path)
-    return os.path.splitext(filename)[0]
+    filename: str = path[path.rfind(os.sep) + 1 :]
+    dot: int = filename.rfind(".")
+    return filename[:dot] if dot > 0 else filename
 
 
 def get_drive(path: str) -> str:
@@ -86,17 +102,12 @@ def set_windows_file_hidden(file: str) -> bool:
 
     :raises ctypes.WinError: If the file cannot be set as hidden.
     """
-    if "windows" in platform.system().lower():
-        import ctypes
+    if not IS_WINDOWS:
+        return False
 
-        ctypes.windll.kernel32.SetFileAttributesW.argtypes = (
-            ctypes.c_wchar_p,
-            ctypes.c_uint32,
-        )
-        ret: int = ctypes.windll.kernel32.SetFileAttributesW(file, 0x02)
+    ret: int = _set_file_attributes(file, 0x02)
 
-        if not ret:
-            raise ctypes.WinError()
+    if not ret:
+        raise ctypes.WinError()
 
-        return True
-    return False
+    return True
@@ -3,9 +3,17 @@ import random
 from sails.common.dictionary import words
 
 
+_RNG = random.SystemRandom()
+"""A single shared OS-backed random generator.
+
+:type: `random.SystemRandom`
+"""
+
+
 class RandomString:
     """Class to generate a random string made up of multiple segments separated by a given separator."""
 
+    @staticmethod
     def generate(segments: int, seperator: str = "-") -> str:
         """Generates a random string made up of multiple segments separated by a given separator.
 
@@ -16,5 +24,5 @@ class RandomString:
         :return: The generated string.
         :rtype: str
         """
-        generated_words: list[str] = random.sample(words, segments)
+        generated_words: list[str] = _RNG.sample(words, segments)
         return seperator.join(generated_words)
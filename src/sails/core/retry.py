@@ -3,173 +3,75 @@ from typing import Iterator, Optional
 
 
 class Retry:
-    """Base class for retry logic.
+    """Iterable retry logic combining attempt, time and backoff limits.
 
-    The `Retry` class provides a unified interface for defining retry logic. This class is meant to be subclassed
-    to provide specific retry implementations.
+    Iterating a `Retry` yields once per attempt, sleeping with exponential
+    backoff between attempts when `backoff` is set, and stops once the attempt
+    or time budget is exhausted. All limits are applied inside a single
+    generator, so iteration costs one generator resume per attempt regardless
+    of how many limits are active.
 
     """
 
-    @property
-    def attempts(self) -> Iterator[Optional[float]]:
-        """Return an iterator that yields the time in seconds to wait before each attempt.
-
-        The iterator should yield `None` if there is no time to wait before the next attempt.
-
-        """
-        raise NotImplementedError
-
-    def __iter__(self) -> Iterator[Optional[float]]:
-        """Return an iterator that yields the time in seconds to wait before each attempt."""
-        return self.attempts
-
-    @staticmethod
-    def __new__(attempts: int = 0, time: float = 0.0, backoff: float = 0.0) -> "Retry":
-        """Return an instance of Retry that has the desired retry logic.
+    def __init__(
+        self, attempts: int = 0, time: float = 0.0, backoff: float = 0.0
+    ) -> None:
+        """Initialize the retry object.
 
-        :param attempts: The number of attempts to make before giving up. Defaults to 0.
+        :param attempts: The number of attempts to make before giving up. Defaults to 0 (unlimited).
         :type attempts: int, optional
-        :param time: The maximum time in seconds to spend on attempts. Defaults to 0.0.
+        :param time: The maximum time in seconds to spend on attempts. Defaults to 0.0 (unlimited).
         :type time: float, optional
-        :param backoff: The time in seconds to wait before the first attempt. Defaults to 0.0.
+        :param backoff: The time in seconds to wait after the first failed attempt. Subsequent wait times
+                        are calculated as 2^(n-1) * `backoff`, where `n` is the number of attempts.
+                        Defaults to 0.0 (no waiting).
         :type backoff: float, optional
-        :return: An instance of Retry that has the desired retry logic.
-        :rtype: Retry
-
-        """
-        retry: Retry = InfiniteRetry()
-
-        if attempts:
-            retry = AttemptRetry(retry, attempts)
-
-        if time:
-            retry = TimedRetry(retry, time)
-
-        if backoff:
-            retry = BackoffRetry(retry, backoff)
-
-        return retry
-
-
-class InfiniteRetry(Retry):
-    """An implementation of retry that never stops trying.
-
-    This class extends the `Retry` class and provides an implementation that never stops trying. The `attempts`
-    property returns an iterator that yields `None` indefinitely.
-
-    """
-
-    @property
-    def attempts(self) -> Iterator[Optional[float]]:
-        """Return an iterator that yields `None` indefinitely."""
-        while True:
-            yield None
-
-
-class AttemptRetry(Retry):
-    """An implementation of retry that stops after a fixed number of attempts.
-
-    This class extends the `Retry` class and provides an implementation that stops after a fixed number of attempts.
-    The `attempts` property returns an iterator that yields `None` up to a maximum number of attempts.
-
-    """
-
-    def __init__(self, retry: Retry, max_attempts: int) -> None:
-        """Initialize the retry object.
-
-        :param retry: The underlying retry implementation to use.
-        :type retry: Retry
-        :param max_attempts: The maximum number of attempts to make before giving up.
-        :type max_attempts: int
-
-        """
-        self.retry: Retry = retry
-        self.max_attempts: int = max_attempts
 
-    @property
-    def attempts(self) -> Iterator[Optional[float]]:
-        """Return an iterator that yields `None` up to a maximum number of attempts."""
-        for attempt, remaining in enumerate(self.retry):
-            if attempt == self.max_attempts:
-                break
-
-            yield remaining
-
-
-class TimedRetry(Retry):
-    """An implementation of retry that stops after a fixed amount of time.
-
-    This class extends the `Retry` class and provides an implementation that stops after a fixed amount of time. The
-    `attempts` property returns an iterator that yields the remaining time after each attempt.
-
-    """
-
-    def __init__(self, retry: Retry, time: float) -> None:
-        """Initialize the retry object.
-
-        :param retry: The underlying retry implementation to use.
-        :type retry: Retry
-        :param time: The amount of time, in seconds, to keep retrying.
-        :type time: float
-
-        :raises ValueError: If `time` is negative or 0.
+        :raises ValueError: If `attempts`, `time` or `backoff` is negative.
 
         """
-        if time >= 0:
-            raise ValueError("Time cannot be negative or 0.")
-
-        self.retry: Retry = retry
+        if attempts < 0:
+            raise ValueError("Attempts cannot be negative.")
+        if time < 0:
+            raise ValueError("Time cannot be negative.")
+        if backoff < 0:
+            raise ValueError("Backoff cannot be negative.")
+
+        self.max_attempts: int = attempts
         self.time: float = time
+        self.backoff: float = backoff
 
     @property
     def attempts(self) -> Iterator[Optional[float]]:
-        """Return an iterator that yields the remaining time after each attempt."""
-        start: float = time.time()
-
-        yield self.time
+        """Return an iterator that yields the time in seconds remaining before each attempt.
 
-        for _ in self.retry:
-            elapsed: float = time.time() - start
-            remaining: float = self.time - elapsed
+        The iterator yields `None` before each attempt when no time limit is set.
 
-            if remaining <= 0:
-                break
-
-            yield remaining
-
-
-class BackoffRetry(Retry):
-    """An implementation of retry that increases the wait time between each attempt.
-
-    This class extends the `Retry` class and provides an implementation that increases the wait time between each
-    attempt. The `attempts` property returns an iterator that yields the remaining time after each attempt.
-
-    """
+        """
+        start: float = time.monotonic()
+        attempt: int = 0
 
-    def __init__(self, retry: Retry, backoff: float) -> None:
-        """Initialize the retry object.
+        while not self.max_attempts or attempt < self.max_attempts:
+            remaining: Optional[float] = None
 
-        :param retry: The underlying retry implementation to use.
-        :type retry: Retry
-        :param backoff: The time, in seconds, to wait after the first failed attempt. Subsequent wait times are
-                        calculated as 2^(n-1) * `backoff`, where `n` is the number of attempts.
-        :type backoff: float
+            if self.time:
+                remaining = self.time - (time.monotonic() - start)
 
-        """
-        self.retry: Retry = retry
-        self.backoff: float = backoff
+                if remaining <= 0:
+                    break
 
-    @property
-    def attempts(self) -> Iterator[Optional[float]]:
-        """Return an iterator that yields the remaining time after each attempt."""
-        for attempt, remaining in enumerate(self.retry):
-            if attempt > 0:
+            if attempt > 0 and self.backoff:
                 delay: float = self.backoff * 2.0 ** (attempt - 1.0)
 
-                if remaining:
+                if remaining is not None:
                     delay = min(delay, remaining)
                     remaining -= delay
 
                 time.sleep(delay)
 
             yield remaining
+            attempt += 1
+
+    def __iter__(self) -> Iterator[Optional[float]]:
+        """Return an iterator that yields the time in seconds remaining before each attempt."""
+        return self.attempts
@@ -68,7 +68,7 @@ def profiler(function: Callable) -> Callable:
         profile: Profile = Profile()
         result: Value = profile.runcall(function, *args, **kwargs)
         file_name: str = SDKDirectory().get_file_name(
-            "/profiles/" + function.__name__ + "-" + RandomString().generate()
+            "/profiles/" + function.__name__ + "-" + RandomString.generate(2)
         )
 
         profile.dump_stats(file_name)
@@ -1,12 +1,15 @@
 import os
-from typing import TypedDict
+from functools import cached_property
+from typing import Iterator, NamedTuple, Optional
 
 from sails.core.path import set_windows_file_hidden
 
-FOLDER_NAME: str = ".overflow/sails/"
+FOLDER_NAME: str = os.sep.join((".overflow", "sails")) + os.sep
+_STAT_CACHE_SIZE: int = 1024
+_set_hidden = set_windows_file_hidden if os.name == "nt" else (lambda path: False)
 
 
-class ListResult(TypedDict):
+class ListResult(NamedTuple):
     """
     This class represents the result of a list operation.
 
@@ -25,34 +28,90 @@ class SDKDirectory:
     to list the files and subdirectories within a specified directory and to generate a file name in the Sails SDK directory structure.
     """
 
+    _instance: Optional["SDKDirectory"] = None
+
+    def __new__(cls) -> "SDKDirectory":
+        """
+        Returns the process-wide `SDKDirectory` instance, creating it on first use.
+
+        The SDK root is a process-global resource, so construction is memoized and
+        the path resolution and directory creation run only once per process.
+        """
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+
+        return cls._instance
+
     def __init__(self) -> None:
         """
         Initializes a new instance of the `SDKDirectory` class.
 
-        This constructor creates the root directory for the Sails SDK if it does not exist and sets it as hidden if the operating system is Windows.
+        Resolution and creation of the root directory are deferred until the
+        `folder` property is first accessed.
+        """
+        if hasattr(self, "_stat_cache"):
+            return
+
+        self._stat_cache: dict[str, Optional[os.stat_result]] = {}
+
+    @cached_property
+    def folder(self) -> str:
         """
-        self.folder = os.path.join(os.path.expanduser(), FOLDER_NAME)
+        The root directory for the Sails SDK, resolved on first access.
 
-        if not os.path.exists(self.folder):
-            os.mkdir(self.folder)
-            set_windows_file_hidden(self.folder)
+        Accessing this property creates the directory if it does not exist and
+        sets it as hidden if the operating system is Windows.
+
+        :type: str
+        """
+        folder: str = os.path.expanduser("~") + os.sep + FOLDER_NAME
+
+        try:
+            os.makedirs(folder)
+        except FileExistsError:
+            pass
+        else:
+            _set_hidden(folder)
+
+        return folder
 
     def list_files(self, subfolder: str = "") -> ListResult:
         """Lists the files and subdirectories within the specified SDK subfolder.
 
         :param subfolder: the subfolder to list files and subfolders from.
         :type subfolder: str, optional
-        :return: a dictionary containing a list of files and a list of subfolders.
+        :return: a named tuple containing a list of files and a list of subfolders.
         :rtype: ListResult
         """
-        folder: str = os.path.join(self.folder, subfolder)
-        listdir: list[str] = os.listdir(folder)
+        files: list[str] = []
+        folders: list[str] = []
+        append_file = files.append
+        append_folder = folders.append
 
-        files: list[str] = [item for item in listdir if os.path.isfile(item)]
-        folders: list[str] = [item for item in listdir if os.path.isdir(item)]
+        for entry in self.iter_entries(subfolder):
+            if entry.is_dir(follow_symlinks=False):
+                append_folder(entry.name)
+            else:
+                append_file(entry.name)
 
         return ListResult(files, folders)
 
+    def iter_entries(self, subfolder: str = "") -> Iterator[os.DirEntry]:
+        """Iterates lazily over the entries of the specified SDK subfolder.
+
+        Entries are yielded straight from `os.scandir` without materialising a
+        list, so memory usage stays constant and callers can stop early. Entry
+        type and stat information are available through the `os.DirEntry`
+        interface.
+
+        :param subfolder: the subfolder to iterate entries from.
+        :type subfolder: str, optional
+        :return: an iterator over the entries of the subfolder.
+        :rtype: Iterator[os.DirEntry]
+        """
+        with os.scandir(self.folder + subfolder) as entries:
+            yield from entries
+
     def get_file_name(self, file: str) -> str:
         """Generates a file name in the Sails SDK directory structure.
 
@@ -61,4 +120,33 @@ class SDKDirectory:
         :return: the full file name.
         :rtype: str
         """
-        return os.path.join(self.folder, file)
+        return self.folder + file
+
+    def stat(self, file: str) -> Optional[os.stat_result]:
+        """Stats a file in the Sails SDK directory structure, caching the result.
+
+        Both hits and misses are cached, so repeated probes for the same file
+        cost one stat syscall per unique name rather than one per call. Cached
+        entries persist until evicted, so a file created or removed behind the
+        cache's back is not noticed.
+
+        :param file: the name of the file.
+        :type file: str
+        :return: the stat result for the file, or None if it does not exist.
+        :rtype: Optional[os.stat_result]
+        """
+        try:
+            return self._stat_cache[file]
+        except KeyError:
+            pass
+
+        try:
+            result: Optional[os.stat_result] = os.stat(self.folder + file)
+        except FileNotFoundError:
+            result = None
+
+        if len(self._stat_cache) >= _STAT_CACHE_SIZE:
+            self._stat_cache.popitem()
+
+        self._stat_cache[file] = result
+        return result